@@ -10,6 +10,7 @@ use engine::{
     campaign, run, Balance, Event, LossReason, Objective, Outcome, PlanStrategy, ScenarioStrategy,
     Strategy, TournamentStrategy, World,
 };
+use std::io::{BufWriter, Write};
 
 fn main() {
     let args: Vec<String> = std::env::args().skip(1).collect();
@@ -44,9 +45,7 @@ fn main() {
     let mut world = World::demo(seed).with_balance(load_balance());
     let trace = run(&mut world, strategy.as_mut(), turns);
 
-    for event in &trace {
-        println!("{}", render(event));
-    }
+    print_trace(&trace);
 
     println!("{}", "-".repeat(60));
     println!(
@@ -104,18 +103,16 @@ fn run_scenario(args: &[String]) {
     };
     let trace = run(&mut world, &mut strategy, 400);
 
-    for event in &trace {
-        if matches!(
+    print_trace(trace.iter().filter(|event| {
+        matches!(
             event,
             Event::TournamentScheduled { .. }
                 | Event::TournamentResult { .. }
                 | Event::ScenarioWon { .. }
                 | Event::ScenarioLost { .. }
                 | Event::Bankrupt { .. }
-        ) {
-            println!("{}", render(event));
-        }
-    }
+        )
+    }));
 
     let result = match world.outcome {
         Outcome::Won => "WON",
@@ -135,6 +132,16 @@ fn run_scenario(args: &[String]) {
     );
 }
 
+/// Print rendered events through one locked, buffered handle — a long run is
+/// thousands of lines, and `println!` would lock and flush stdout for each.
+fn print_trace<'a>(events: impl IntoIterator<Item = &'a Event>) {
+    let mut out = BufWriter::new(std::io::stdout().lock());
+    for event in events {
+        writeln!(out, "{}", render(event)).unwrap();
+    }
+    out.flush().unwrap();
+}
+
 fn render(event: &Event) -> String {
     match event {
         Event::TurnStarted { turn } => format!("\n── turn {turn} ──"),
@@ -47,10 +47,20 @@ pub fn step(world: &mut World, decisions: &Decisions, trace: &mut Trace) {
         (world.ops.staff_capacity - prep_spent).max(0.0),
         trace,
     );
-    systems::prestige_update(world, trace);
-    let attention = systems::tournament_tick(world, trace);
+    // Conditions hold still until golfers wear the course, so score them once for
+    // every system in between.
+    let conditions = world.course.avg_health(&world.balance.conditions);
+    systems::prestige_update(world, conditions, trace);
+    let attention = systems::tournament_tick(world, conditions, trace);
     systems::tournament_accept(world, decisions.accept_tournament, trace);
-    let outcome = systems::demand_and_revenue(world, decisions.price, dryness, attention, trace);
+    let outcome = systems::demand_and_revenue(
+        world,
+        decisions.price,
+        dryness,
+        conditions,
+        attention,
+        trace,
+    );
     systems::wear_from_traffic(world, outcome.golfers);
     systems::standing_update(world, &outcome);
     systems::economy(world, outcome.revenue, outcome.golfers, trace);
@@ -34,6 +34,18 @@ pub struct Region {
 }
 
 impl Region {
+    /// A freshly laid region: well watered and fed, short, and unworn.
+    pub fn new(id: u32, kind: RegionKind) -> Self {
+        Region {
+            id,
+            kind,
+            moisture: 65.0,
+            nutrients: 75.0,
+            growth: 10.0,
+            wear: 0.0,
+        }
+    }
+
     /// Condition of this region, 0..100, derived from its agronomic state and the
     /// tuneable condition weights/factors.
     pub fn health(&self, c: &ConditionsBalance) -> f64 {
@@ -624,18 +636,11 @@ impl CourseSpec {
                 }
             }
         }
-        let mut regions = Vec::new();
+        let mut regions = Vec::with_capacity(self.holes as usize * per_hole.len());
         let mut id = 0u32;
         for _ in 0..self.holes {
             for &kind in &per_hole {
-                regions.push(Region {
-                    id,
-                    kind,
-                    moisture: 65.0,
-                    nutrients: 75.0,
-                    growth: 10.0,
-                    wear: 0.0,
-                });
+                regions.push(Region::new(id, kind));
                 id += 1;
             }
         }
@@ -846,24 +851,23 @@ impl World {
         self
     }
 
-    /// Have the unlocked techs (in order) enabled the irrigation system yet?
-    pub fn irrigation_unlocked(&self) -> bool {
+    /// The techs unlocked so far, in research order.
+    pub fn unlocked_techs(&self) -> impl Iterator<Item = &Tech> {
         self.balance
             .research
             .techs
             .iter()
             .take(self.research.unlocked as usize)
-            .any(|t| t.unlocks_irrigation)
+    }
+
+    /// Have the unlocked techs (in order) enabled the irrigation system yet?
+    pub fn irrigation_unlocked(&self) -> bool {
+        self.unlocked_techs().any(|t| t.unlocks_irrigation)
     }
 
     /// Have the unlocked techs enabled robot units yet? (The elite endgame.)
     pub fn robots_unlocked(&self) -> bool {
-        self.balance
-            .research
-            .techs
-            .iter()
-            .take(self.research.unlocked as usize)
-            .any(|t| t.unlocks_robots)
+        self.unlocked_techs().any(|t| t.unlocks_robots)
     }
 
     /// Set up a scenario run: build its course (replacing the sandbox course),
@@ -899,14 +903,7 @@ impl World {
         let regions = kinds
             .iter()
             .enumerate()
-            .map(|(i, &kind)| Region {
-                id: i as u32,
-                kind,
-                moisture: 65.0,
-                nutrients: 75.0,
-                growth: 10.0,
-                wear: 0.0,
-            })
+            .map(|(i, &kind)| Region::new(i as u32, kind))
             .collect();
         World {
             turn: 0,
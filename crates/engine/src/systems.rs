@@ -4,8 +4,7 @@
 
 use crate::event::{Event, Trace};
 use crate::model::{
-    LossReason, Objective, Outcome, PrepTask, TournamentPhase, TournamentState, TournamentTier,
-    World,
+    LossReason, Objective, Outcome, PrepTask, TournamentPhase, TournamentState, World,
 };
 
 /// Outcome of the demand system for one turn.
@@ -20,10 +19,9 @@ pub(crate) struct DemandOutcome {
 /// each a 0..0.85 fraction. These are how research lets a player cope with
 /// scaling up to bigger courses.
 pub(crate) fn tech_bonuses(world: &World) -> (f64, f64) {
-    let n = world.research.unlocked as usize;
     let mut mow = 0.0;
     let mut irr = 0.0;
-    for tech in world.balance.research.techs.iter().take(n) {
+    for tech in world.unlocked_techs() {
         mow += tech.mower_efficiency;
         irr += tech.irrigation;
     }
@@ -40,11 +38,13 @@ pub(crate) fn research_tick(world: &mut World, funding: f64, trace: &mut Trace)
     world.research.points += spend * world.balance.research.funding_to_points;
     while (world.research.unlocked as usize) < world.balance.research.techs.len() {
         let idx = world.research.unlocked as usize;
-        let next = world.balance.research.techs[idx].clone();
+        let next = &world.balance.research.techs[idx];
         if world.research.points >= next.cost {
             world.research.points -= next.cost;
             world.research.unlocked += 1;
-            trace.push(Event::TechUnlocked { name: next.name });
+            trace.push(Event::TechUnlocked {
+                name: next.name.clone(),
+            });
         } else {
             break;
         }
@@ -62,7 +62,7 @@ pub(crate) fn weather(world: &mut World, trace: &mut Trace) -> f64 {
 pub(crate) fn agronomy(world: &mut World, extra_dryness: f64) {
     let nutrient_decay = world.balance.economy.nutrient_decay;
     let irrigation = tech_bonuses(world).1; // research cuts moisture loss
-    let agro = world.balance.agronomy.clone();
+    let agro = &world.balance.agronomy;
     for r in world.course.regions.iter_mut() {
         let rates = agro.rates(r.kind);
         let moisture_loss = rates.moisture_decay * (1.0 - irrigation) + extra_dryness;
@@ -86,7 +86,7 @@ pub(crate) fn automation(
     buy_robots: u32,
     trace: &mut Trace,
 ) {
-    let a = world.balance.automation.clone();
+    let a = &world.balance.automation;
     // Both automations are research-gated: the irrigation system mid-tree, robots
     // as the elite endgame unlock.
     if buy_irrigation
@@ -157,8 +157,7 @@ pub(crate) fn automation(
 /// within `capacity`. When needs outrun what crew + machines can reach, conditions
 /// slip — the core allocation tension.
 pub(crate) fn maintenance(world: &mut World, capacity: f64, trace: &mut Trace) {
-    let c = world.balance.conditions.clone();
-    let agro = world.balance.agronomy.clone();
+    let agro = &world.balance.agronomy;
     // Better mowers/equipment make the mowing job cheaper.
     let mow_cost = agro.mow_cost * (1.0 - tech_bonuses(world).0);
     let n = world.course.regions.len();
@@ -175,13 +174,7 @@ pub(crate) fn maintenance(world: &mut World, capacity: f64, trace: &mut Trace) {
     let robot_reach = (working * world.balance.automation.robot_throughput).floor() as usize;
     let mut robot_done = vec![false; n];
     if robot_reach > 0 {
-        let mut order: Vec<usize> = (0..n).collect();
-        order.sort_by(|&a, &b| {
-            world.course.regions[a]
-                .health(&c)
-                .total_cmp(&world.course.regions[b].health(&c))
-        });
-        for &i in order.iter().take(robot_reach) {
+        for &i in neediest_first(world).iter().take(robot_reach) {
             let r = &mut world.course.regions[i];
             r.growth = agro.serviced_growth;
             r.nutrients = agro.serviced_nutrients;
@@ -191,23 +184,16 @@ pub(crate) fn maintenance(world: &mut World, capacity: f64, trace: &mut Trace) {
     }
 
     // Crew covers the remaining jobs, neediest-first, within capacity.
-    let mut order: Vec<usize> = (0..n).collect();
-    order.sort_by(|&a, &b| {
-        world.course.regions[a]
-            .health(&c)
-            .total_cmp(&world.course.regions[b].health(&c))
-    });
+    // Per-job costs are the same for every region; only whether robots got there
+    // first varies.
+    let need_water = !world.irrigation;
+    let water_cost = if need_water { agro.water_cost } else { 0.0 };
+    let mowfert_cost = mow_cost + agro.fertilize_cost;
     let mut budget = capacity;
     let mut serviced = 0u32;
-    for i in order {
-        let need_water = !world.irrigation;
+    for i in neediest_first(world) {
         let need_mowfert = !robot_done[i];
-        let cost = if need_water { agro.water_cost } else { 0.0 }
-            + if need_mowfert {
-                mow_cost + agro.fertilize_cost
-            } else {
-                0.0
-            };
+        let cost = water_cost + if need_mowfert { mowfert_cost } else { 0.0 };
         if cost <= 0.0 || budget < cost {
             continue;
         }
@@ -229,6 +215,16 @@ pub(crate) fn maintenance(world: &mut World, capacity: f64, trace: &mut Trace) {
     });
 }
 
+/// Region indices ordered neediest-first (lowest health). Health is scored once
+/// per region up front, not on every comparison the sort makes.
+fn neediest_first(world: &World) -> Vec<usize> {
+    let c = &world.balance.conditions;
+    let health: Vec<f64> = world.course.regions.iter().map(|r| r.health(c)).collect();
+    let mut order: Vec<usize> = (0..health.len()).collect();
+    order.sort_by(|&a, &b| health[a].total_cmp(&health[b]));
+    order
+}
+
 /// Amenities prestige component (0..100), derived from capex (amenity_level).
 pub(crate) fn amenities_score(world: &World) -> f64 {
     (world.ops.amenity_level * world.balance.prestige.amenity_per_level).clamp(0.0, 100.0)
@@ -237,10 +233,10 @@ pub(crate) fn amenities_score(world: &World) -> f64 {
 /// Prestige is the holistic experience: a weighted blend of current conditions,
 /// historical track record, amenities, reputation, and exclusivity. It moves
 /// toward that blend asymmetrically — slow to build, fast to fall — and it is what
-/// sets pricing power in `demand_and_revenue`.
-pub(crate) fn prestige_update(world: &mut World, trace: &mut Trace) {
-    let p = world.balance.prestige.clone();
-    let conditions = world.course.avg_health(&world.balance.conditions);
+/// sets pricing power in `demand_and_revenue`. `conditions` is this turn's average
+/// region health.
+pub(crate) fn prestige_update(world: &mut World, conditions: f64, trace: &mut Trace) {
+    let p = &world.balance.prestige;
     trace.push(Event::Conditions {
         avg_health: conditions,
         avg_wear: world.course.avg_wear(),
@@ -269,17 +265,18 @@ pub(crate) fn prestige_update(world: &mut World, trace: &mut Trace) {
 /// Segmented, value-based demand. Pricing power is the holistic prestige
 /// experience (with a little weight on today's conditions): a higher-prestige
 /// course draws more golfers and commands more before they balk. Playing golfers
-/// also generate secondary revenue and a satisfaction signal.
+/// also generate secondary revenue and a satisfaction signal. `avg_health` is this
+/// turn's average region health.
 pub(crate) fn demand_and_revenue(
     world: &mut World,
     price: f64,
     dryness: f64,
+    avg_health: f64,
     attention: f64,
     trace: &mut Trace,
 ) -> DemandOutcome {
     world.finances.price = price;
-    let dm = world.balance.demand.clone();
-    let avg_health = world.course.avg_health(&world.balance.conditions);
+    let dm = &world.balance.demand;
     let worst_green = world.course.worst_green_health(&world.balance.conditions);
     // Perceived conditions: the worst green drags the signal down, so neglecting
     // the surfaces golfers judge by repels play even on an otherwise tidy course.
@@ -351,7 +348,7 @@ pub(crate) fn demand_and_revenue(
 /// record and reputation build slowly and fall faster; exclusivity reflects how
 /// high-end your pricing and clientele are. These shape *next* turn's prestige.
 pub(crate) fn standing_update(world: &mut World, outcome: &DemandOutcome) {
-    let p = world.balance.prestige.clone();
+    let p = &world.balance.prestige;
     let conditions = world.course.avg_health(&world.balance.conditions);
     let h_rate = if conditions >= world.standing.historical_excellence {
         p.hist_up_rate
@@ -388,8 +385,8 @@ pub(crate) fn tournament_accept(world: &mut World, tier_idx: Option<usize>, trac
     if world.tournament.is_some() {
         return;
     }
-    let tb = world.balance.tournament.clone();
-    let Some(tier) = tb.tiers.get(idx).cloned() else {
+    let tb = &world.balance.tournament;
+    let Some(tier) = tb.tiers.get(idx) else {
         return;
     };
     if world.standing.prestige < tier.prestige_required || world.finances.cash < tier.entry_cost {
@@ -414,16 +411,17 @@ pub(crate) fn tournament_accept(world: &mut World, tier_idx: Option<usize>, trac
         },
     });
     trace.push(Event::TournamentScheduled {
-        tier: tier.name,
+        tier: tier.name.clone(),
         starts_in: tier.prep_turns,
     });
 }
 
 /// Pick `n` distinct tasks from a pool using the seeded RNG. Deterministic.
 fn pick_distinct(pool: &[PrepTask], n: usize, rng: &mut crate::rng::Rng) -> Vec<PrepTask> {
+    let n = n.min(pool.len());
     let mut idxs: Vec<usize> = (0..pool.len()).collect();
-    let mut out = Vec::new();
-    for _ in 0..n.min(pool.len()) {
+    let mut out = Vec::with_capacity(n);
+    for _ in 0..n {
         let k = ((rng.next_f64() * idxs.len() as f64) as usize).min(idxs.len() - 1);
         out.push(pool[idxs.remove(k)].clone());
     }
@@ -466,13 +464,13 @@ pub(crate) fn tournament_prep(world: &mut World, prep_effort: f64, trace: &mut T
 /// Advance a booked tournament: count down prep, then run the event accumulating
 /// conditions. Returns the demand-surge "attention" multiplier for this turn (1.0
 /// when no event is live). Resolves and grades the event on its final day.
-pub(crate) fn tournament_tick(world: &mut World, trace: &mut Trace) -> f64 {
-    let conditions = world.course.avg_health(&world.balance.conditions);
+/// `conditions` is this turn's average region health.
+pub(crate) fn tournament_tick(world: &mut World, conditions: f64, trace: &mut Trace) -> f64 {
     let Some(mut state) = world.tournament.take() else {
         return 1.0;
     };
-    let tier = world.balance.tournament.tiers[state.tier].clone();
     let tier_idx = state.tier;
+    let tier = &world.balance.tournament.tiers[tier_idx];
     let mut attention = 1.0;
 
     match &mut state.phase {
@@ -504,7 +502,6 @@ pub(crate) fn tournament_tick(world: &mut World, trace: &mut Trace) -> f64 {
                     resolve_tournament(
                         world,
                         tier_idx,
-                        &tier,
                         conditions,
                         readiness,
                         optional_done,
@@ -533,7 +530,7 @@ pub(crate) fn tournament_tick(world: &mut World, trace: &mut Trace) -> f64 {
             if *day >= tier.duration {
                 let avg = *condition_sum / *day as f64;
                 let (r, od) = (*readiness, *optional_done);
-                resolve_tournament(world, tier_idx, &tier, avg, r, od, trace);
+                resolve_tournament(world, tier_idx, avg, r, od, trace);
             } else {
                 world.tournament = Some(state);
             }
@@ -548,12 +545,12 @@ pub(crate) fn tournament_tick(world: &mut World, trace: &mut Trace) -> f64 {
 fn resolve_tournament(
     world: &mut World,
     tier_idx: usize,
-    tier: &TournamentTier,
     avg_condition: f64,
     readiness: f64,
     optional_done: bool,
     trace: &mut Trace,
 ) {
+    let tier = &world.balance.tournament.tiers[tier_idx];
     let condition_grade =
         ((avg_condition - tier.fail_floor) / (tier.target - tier.fail_floor)).clamp(0.0, 1.0);
     let grade = condition_grade * readiness;
@@ -583,7 +580,7 @@ fn resolve_tournament(
 /// back onto conditions: the more play you take, the harder it is to stay
 /// pristine. The brake and the flywheel are the same mechanism.
 pub(crate) fn wear_from_traffic(world: &mut World, golfers: f64) {
-    let agro = world.balance.agronomy.clone();
+    let agro = &world.balance.agronomy;
     let total_wear = golfers * world.balance.economy.wear_per_golfer;
     let weight_sum: f64 = world
         .course
@@ -628,7 +625,7 @@ pub(crate) fn objective_check(world: &mut World, trace: &mut Trace) {
     if !world.outcome.is_running() {
         return;
     }
-    let Some(scenario) = world.scenario.clone() else {
+    let Some(scenario) = world.scenario.as_ref() else {
         return;
     };
     let (met, deadline) = match scenario.objective {
@@ -647,15 +644,16 @@ pub(crate) fn objective_check(world: &mut World, trace: &mut Trace) {
         Objective::Survive { turns } => (world.turn >= turns, None),
     };
 
+    // Most turns resolve nothing, so the name is only copied out for the event.
     if met {
+        let scenario = scenario.name.clone();
         world.outcome = Outcome::Won;
-        trace.push(Event::ScenarioWon {
-            scenario: scenario.name.clone(),
-        });
+        trace.push(Event::ScenarioWon { scenario });
     } else if deadline.is_some_and(|d| world.turn >= d) {
+        let scenario = scenario.name.clone();
         world.outcome = Outcome::Lost(LossReason::Deadline);
         trace.push(Event::ScenarioLost {
-            scenario: scenario.name.clone(),
+            scenario,
             reason: "deadline".to_string(),
         });
     }
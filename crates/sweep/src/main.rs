@@ -24,7 +24,8 @@ fn load_balance() -> Balance {
     }
 }
 
-type Factory = Box<dyn Fn() -> Box<dyn Strategy>>;
+// `Sync` so a path's factory can be shared by the worker threads in `run_seeds`.
+type Factory = Box<dyn Fn() -> Box<dyn Strategy> + Sync>;
 
 struct Path {
     name: &'static str,
@@ -82,7 +83,7 @@ struct RunResult {
 }
 
 fn run_one(
-    make_world: &dyn Fn(u64) -> World,
+    make_world: &(dyn Fn(u64) -> World + Sync),
     path: &Path,
     balance: &Balance,
     seed: u64,
@@ -108,6 +109,37 @@ fn run_one(
     }
 }
 
+/// Run `path` over seeds `1..=seeds`, split into contiguous blocks across the
+/// available cores. Runs are independent and deterministic, so results come back
+/// in seed order exactly as a serial loop would produce them.
+fn run_seeds(
+    make_world: &(dyn Fn(u64) -> World + Sync),
+    path: &Path,
+    balance: &Balance,
+    seeds: u64,
+    turns: u32,
+) -> Vec<RunResult> {
+    let workers = std::thread::available_parallelism().map_or(1, |n| n.get()) as u64;
+    let block = seeds.div_ceil(workers);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|w| {
+                let first = w * block + 1;
+                let last = ((w + 1) * block).min(seeds);
+                scope.spawn(move || {
+                    (first..=last)
+                        .map(|s| run_one(make_world, path, balance, s, turns))
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|h| h.join().expect("sweep worker panicked"))
+            .collect()
+    })
+}
+
 fn mean(xs: impl Iterator<Item = f64>) -> f64 {
     let (sum, n) = xs.fold((0.0, 0u64), |(s, n), x| (s + x, n + 1));
     if n == 0 {
@@ -119,7 +151,7 @@ fn mean(xs: impl Iterator<Item = f64>) -> f64 {
 
 fn print_table(
     title: &str,
-    make_world: &dyn Fn(u64) -> World,
+    make_world: &(dyn Fn(u64) -> World + Sync),
     paths: &[Path],
     balance: &Balance,
     seeds: u64,
@@ -133,9 +165,7 @@ fn print_table(
     println!("{}", "-".repeat(64));
 
     for path in paths {
-        let results: Vec<RunResult> = (1..=seeds)
-            .map(|s| run_one(make_world, path, balance, s, turns))
-            .collect();
+        let results = run_seeds(make_world, path, balance, seeds, turns);
         let n = results.len() as f64;
         let bust = results.iter().filter(|r| r.bankrupt).count() as f64 / n * 100.0;
         let mean_cash = mean(results.iter().map(|r| r.final_cash));